@@ -1,10 +1,13 @@
-__all__ = ("NVMeDevice",)
+__all__ = ("NVMeDevice", "smart_page_to_dict")
 import abc
 import sys
 import ctypes
 from dataclasses import dataclass
 from abc import abstractmethod
-from typing import Optional, Tuple, Union, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Tuple, Union
 
 from smartie.device import Device
 from smartie.nvme.errors import NVMeStatusFieldError
@@ -14,13 +17,31 @@ from smartie.nvme.structures import (
     NVMeIdentifyResponse,
     NVMeCQEStatusField,
     SMARTPageResponse,
+    smart_page_to_dict,
 )
-from smartie.structures import structure_to_dict
 
 local_byteorder = sys.byteorder
 
 
-@dataclass
+#: Fixed structure sizes, computed once at import instead of per command.
+_IDENTIFY_RESPONSE_SIZE = ctypes.sizeof(NVMeIdentifyResponse)
+_SMART_PAGE_SIZE = ctypes.sizeof(SMARTPageResponse)
+_STATUS_FIELD_SIZE = ctypes.sizeof(NVMeCQEStatusField)
+
+
+@lru_cache(maxsize=None)
+def _log_page_cdw10(log_page_id: int, size: int) -> int:
+    """
+    Computes (and caches) the CDW10 value for a GET_LOG_PAGE command
+    reading `size` bytes of the given log page.
+
+    In practice log pages have fixed sizes, so in a polling loop this is
+    computed once rather than on every command.
+    """
+    return log_page_id | (((size // 4) - 1) << 16)
+
+
+@dataclass(eq=False)
 class NVMeResponse:
     """
     Common response object for NVMe commands.
@@ -34,6 +55,17 @@ class NVMeResponse:
     command.
     """
 
+    # One of these is created per admin command, so skip the per-instance
+    # __dict__. dataclass(slots=True) would be tidier, but needs 3.10+.
+    __slots__ = (
+        "succeeded",
+        "command_spec",
+        "status_field",
+        "command",
+        "bytes_transferred",
+        "platform_header",
+    )
+
     #: Whether the command succeeded. If None, the status is unknown.
     succeeded: Optional[bool]
     #: The Command Specific value returned by the device.
@@ -59,16 +91,72 @@ class NVMeResponse:
 
 
 class NVMeDevice(Device, abc.ABC):
-    @classmethod
-    def parse_status_field(cls, status_blob) -> Optional[NVMeCQEStatusField]:
+    #: Pre-initialized admin command templates. Copying one of these is a
+    #: single memcpy, where building a fresh NVMeAdminCommand would run a
+    #: ctypes descriptor assignment per field.
+    _IDENTIFY_TEMPLATE = NVMeAdminCommand(
+        opcode=NVMeAdminCommands.IDENTIFY,
+        cdw10=1,
+    )
+    _GET_LOG_PAGE_TEMPLATE = NVMeAdminCommand(
+        opcode=NVMeAdminCommands.GET_LOG_PAGE,
+        nsid=0xFFFFFFFF,
+    )
+
+    def __init__(self, path: Union[Path, str]):
+        super().__init__(path)
+        # Parsed responses to admin commands we've already issued, so that
+        # repeatedly reading properties like `serial` and `temperature`
+        # doesn't issue a full admin command round-trip each time.
+        self._identify_cache = None
+        self._smart_cache = None
+        # Pooled status field, overwritten in place per command instead of
+        # allocating a new structure each time.
+        self._status_field = None
+        # Scratch SMART page reused across polls, so a monitoring loop
+        # isn't allocating a fresh 512-byte structure per refresh.
+        self._smart_scratch = None
+
+    def refresh(self):
+        """
+        Clears any cached command responses, forcing the next call to
+        :meth:`identify()` or :meth:`smart()` to re-query the device.
+        """
+        self._identify_cache = None
+        self._smart_cache = None
+
+    def parse_status_field(
+        self, status_blob
+    ) -> Optional[NVMeCQEStatusField]:
         """
         Parses the command status field from an NVMe command, raising a
         :class:`smartie.nvme.errors.NVMeStatusFieldError` if an error occurred.
 
         :param status_blob: A bytes/bytearray (or similar) object containing
                             the unparsed sense response.
+
+        .. note::
+
+            The returned structure is pooled on the device and overwritten
+            in place by the next command, so treat it as a short-lived
+            view rather than keeping a reference to it.
         """
-        status_field = NVMeCQEStatusField.from_buffer_copy(status_blob)
+        if self._status_field is None:
+            self._status_field = NVMeCQEStatusField()
+
+        status_field = self._status_field
+        if not isinstance(status_blob, bytes):
+            status_blob = bytes(status_blob)
+        if len(status_blob) < _STATUS_FIELD_SIZE:
+            raise ValueError(
+                f"Buffer size too small ({len(status_blob)} instead of at"
+                f" least {_STATUS_FIELD_SIZE} bytes)"
+            )
+        # Copy exactly the structure's size - blobs are allowed to be
+        # longer than the status field itself.
+        ctypes.memmove(
+            ctypes.addressof(status_field), status_blob, _STATUS_FIELD_SIZE
+        )
         if status_field.status_code != 0 or status_field.status_code_type != 0:
             raise NVMeStatusFieldError(
                 status_field.status_code,
@@ -85,27 +173,83 @@ class NVMeDevice(Device, abc.ABC):
         """
         Returns the parsed IDENTIFY results for CNS 01h, which contains
         the controller information.
+
+        The result is cached for as long as the device is open, so reading
+        several properties backed by IDENTIFY only issues a single admin
+        command. Use :meth:`refresh()` to discard the cache.
         """
+        if self._identify_cache is not None:
+            return self._identify_cache
+
         data = NVMeIdentifyResponse()
-        response = self.issue_admin_command(
-            NVMeAdminCommand(
-                opcode=NVMeAdminCommands.IDENTIFY,
-                addr=ctypes.addressof(data),
-                data_len=ctypes.sizeof(data),
-                cdw10=1,
-            )
-        )
-        return data, response
+        command = NVMeAdminCommand.from_buffer_copy(self._IDENTIFY_TEMPLATE)
+        command.addr = ctypes.addressof(data)
+        command.data_len = _IDENTIFY_RESPONSE_SIZE
+        response = self.issue_admin_command(command)
+        self._identify_cache = (data, response)
+        return self._identify_cache
 
     @property
     def serial(self) -> Optional[str]:
         identify, response = self.identify()
-        return bytearray(identify.serial_number).strip(b" \x00").decode()
+        # ctypes.string_at is a single memcpy, where bytearray() would
+        # iterate the ctypes array element-by-element.
+        return (
+            ctypes.string_at(
+                ctypes.addressof(identify)
+                + NVMeIdentifyResponse.serial_number.offset,
+                NVMeIdentifyResponse.serial_number.size,
+            )
+            .strip(b" \x00")
+            .decode()
+        )
 
     @property
     def model(self) -> Optional[str]:
         identify, response = self.identify()
-        return bytearray(identify.model_number).strip(b" \x00").decode()
+        return (
+            ctypes.string_at(
+                ctypes.addressof(identify)
+                + NVMeIdentifyResponse.model_number.offset,
+                NVMeIdentifyResponse.model_number.size,
+            )
+            .strip(b" \x00")
+            .decode()
+        )
+
+    @staticmethod
+    def identify_many(
+        devices: Iterable["NVMeDevice"],
+    ) -> List[Tuple[NVMeIdentifyResponse, "NVMeResponse"]]:
+        """
+        Issues an IDENTIFY to each of the given (already open) devices
+        concurrently, returning the results in the same order.
+
+        The blocking ioctl releases the GIL, so querying N devices takes
+        roughly the time of the slowest command rather than the sum of
+        all of them.
+
+        :param devices: The open devices to query.
+        """
+        devices = list(devices)
+        if not devices:
+            return []
+
+        with ThreadPoolExecutor(
+            max_workers=min(32, len(devices))
+        ) as executor:
+            return list(executor.map(lambda d: d.identify(), devices))
+
+    def identify_strings(self) -> Tuple[str, str]:
+        """
+        Returns the decoded ``(serial, model)`` identity strings.
+
+        Both strings come from the same (cached) IDENTIFY response, so
+        this issues at most one admin command and the caller gets both
+        strings without having to work with the IDENTIFY structure
+        itself.
+        """
+        return self.serial, self.model
 
     @property
     def temperature(self) -> Optional[int]:
@@ -115,21 +259,36 @@ class NVMeDevice(Device, abc.ABC):
     def read_log_page(
         self, log_page_id: int, data: ctypes.Structure
     ) -> tuple[ctypes.Structure, NVMeResponse]:
-        response = self.issue_admin_command(
-            NVMeAdminCommand(
-                opcode=NVMeAdminCommands.GET_LOG_PAGE,
-                addr=ctypes.addressof(data),
-                data_len=ctypes.sizeof(data),
-                nsid=0xFFFFFFFF,
-                cdw10=log_page_id | (((ctypes.sizeof(data) // 4) - 1) << 16),
-            )
-        )
+        size = ctypes.sizeof(data)
+        command = NVMeAdminCommand.from_buffer_copy(self._GET_LOG_PAGE_TEMPLATE)
+        command.addr = ctypes.addressof(data)
+        command.data_len = size
+        command.cdw10 = _log_page_cdw10(log_page_id, size)
+        response = self.issue_admin_command(command)
         return data, response
 
     def smart(self):
-        return self.read_log_page(0x02, SMARTPageResponse())
+        """
+        Returns the parsed SMART log page.
+
+        Like :meth:`identify()`, the result is cached for as long as the
+        device is open. Use :meth:`refresh()` to discard the cache.
+        """
+        if self._smart_cache is None:
+            if self._smart_scratch is None:
+                self._smart_scratch = SMARTPageResponse()
+            else:
+                ctypes.memset(
+                    ctypes.addressof(self._smart_scratch),
+                    0,
+                    _SMART_PAGE_SIZE,
+                )
+            self._smart_cache = self.read_log_page(0x02, self._smart_scratch)
+        return self._smart_cache
 
     @property
     def smart_table(self) -> dict[str, any]:
         smart, response = self.smart()
-        return structure_to_dict(smart)
+        return smart_page_to_dict(
+            ctypes.string_at(ctypes.addressof(smart), ctypes.sizeof(smart))
+        )
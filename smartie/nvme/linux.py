@@ -26,6 +26,7 @@ class LinuxNVMeDevice(NVMeDevice):
         if self.fd is not None:
             os.close(self.fd)
             self.fd = None
+        self.refresh()
         return False
 
     def issue_admin_command(self, command: NVMeAdminCommand) -> NVMeResponse:
@@ -5,6 +5,8 @@ platform-specific APIs.
 """
 import ctypes
 import enum
+import struct
+from typing import Any, Dict
 
 from smartie.structures import c_uint128
 
@@ -120,3 +122,64 @@ class SMARTPageResponse(ctypes.Structure):
         ("total_time_for_thermal_management", ctypes.c_uint32 * 2),
         ("reserved_2", ctypes.c_ubyte * 280),
     ]
+
+
+#: struct format matching the :class:`SMARTPageResponse` layout, so a raw
+#: log page can be unpacked with a single C-level call instead of one
+#: ctypes descriptor invocation per field.
+#: The 128-bit counters are unpacked as pairs of u64 lanes and recombined
+#: with a shift, keeping all the byte-twiddling inside the one C-level
+#: unpack call.
+_SMART_PAGE_STRUCT = struct.Struct("<BHBBBB25s20QII8H2I2I280s")
+#: Bound once so the hot path doesn't re-resolve the method per call.
+_unpack_smart_page = _SMART_PAGE_STRUCT.unpack_from
+
+
+def smart_page_to_dict(buf) -> Dict[str, Any]:
+    """
+    Unpacks a raw SMART log page buffer into a dictionary.
+
+    Produces the same layout as running
+    :func:`smartie.structures.structure_to_dict` over a
+    :class:`SMARTPageResponse`, but unpacks the entire page in one pass
+    rather than walking the structure field-by-field. Monitoring tools
+    that already have the raw log page bytes can call this directly
+    instead of going through a device.
+
+    :param buf: A bytes-like object containing the raw 512-byte SMART
+                log page.
+    """
+    v = _unpack_smart_page(buf)
+    critical_warning = v[0]
+    return {
+        "critical_warning": {
+            "available_spare": critical_warning & 0x01,
+            "temperature": (critical_warning >> 1) & 0x01,
+            "degraded_nvm": (critical_warning >> 2) & 0x01,
+            "read_only": (critical_warning >> 3) & 0x01,
+            "volatile_memory_backup": (critical_warning >> 4) & 0x01,
+            "reserved_1": (critical_warning >> 5) & 0x07,
+        },
+        "temperature": v[1],
+        "available_spare": v[2],
+        "available_spare_threshold": v[3],
+        "percent_used": v[4],
+        "endurance_group_critical_warning_summary": v[5],
+        "reserved_1": list(v[6]),
+        "data_units_read": v[7] | (v[8] << 64),
+        "data_units_written": v[9] | (v[10] << 64),
+        "host_read_commands": v[11] | (v[12] << 64),
+        "host_write_commands": v[13] | (v[14] << 64),
+        "controller_busy_time": v[15] | (v[16] << 64),
+        "power_cycles": v[17] | (v[18] << 64),
+        "power_on_hours": v[19] | (v[20] << 64),
+        "unsafe_shutdowns": v[21] | (v[22] << 64),
+        "media_errors": v[23] | (v[24] << 64),
+        "num_err_log_entries": v[25] | (v[26] << 64),
+        "warning_temp_time": v[27],
+        "critical_temp_time": v[28],
+        "temperature_sensors": list(v[29:37]),
+        "thermal_transition_counts": list(v[37:39]),
+        "total_time_for_thermal_management": list(v[39:41]),
+        "reserved_2": list(v[41]),
+    }
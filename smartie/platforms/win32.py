@@ -1,9 +1,42 @@
 import ctypes
+import ctypes.wintypes
 from functools import cache
 
+#: The HANDLE returned by CreateFileW on failure. With a declared HANDLE
+#: restype this comes back as an unsigned value, not -1.
+INVALID_HANDLE_VALUE = ctypes.wintypes.HANDLE(-1).value
+
 
 @cache
 def get_kernel32():
     # Opens the Kernel32.dll, which can be quite a slow process, and
     # saves it for future use.
-    return ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+    # Declaring the prototypes up front lets ctypes convert arguments with
+    # pre-resolved converters instead of inferring types on every call.
+    kernel32.CreateFileW.argtypes = [
+        ctypes.wintypes.LPCWSTR,
+        ctypes.wintypes.DWORD,
+        ctypes.wintypes.DWORD,
+        ctypes.wintypes.LPVOID,
+        ctypes.wintypes.DWORD,
+        ctypes.wintypes.DWORD,
+        ctypes.wintypes.HANDLE,
+    ]
+    kernel32.CreateFileW.restype = ctypes.wintypes.HANDLE
+    kernel32.CloseHandle.argtypes = [ctypes.wintypes.HANDLE]
+    kernel32.CloseHandle.restype = ctypes.wintypes.BOOL
+    kernel32.DeviceIoControl.argtypes = [
+        ctypes.wintypes.HANDLE,
+        ctypes.wintypes.DWORD,
+        ctypes.wintypes.LPVOID,
+        ctypes.wintypes.DWORD,
+        ctypes.wintypes.LPVOID,
+        ctypes.wintypes.DWORD,
+        ctypes.wintypes.LPDWORD,
+        ctypes.wintypes.LPVOID,
+    ]
+    kernel32.DeviceIoControl.restype = ctypes.wintypes.BOOL
+
+    return kernel32
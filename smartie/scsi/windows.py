@@ -2,7 +2,7 @@ import ctypes
 from typing import Union
 
 from smartie.scsi import SCSIDevice, SCSIResponse
-from smartie.platforms.win32 import get_kernel32
+from smartie.platforms.win32 import INVALID_HANDLE_VALUE, get_kernel32
 from smartie.scsi.structures import (
     Direction,
     IOCTL_SCSI_PASS_THROUGH_DIRECT,
@@ -10,16 +10,25 @@ from smartie.scsi.structures import (
     SCSIPassThroughDirectWithBuffer,
 )
 
+#: Size and offset of the sense buffer, resolved once instead of going
+#: through the field descriptor on every command.
+_SENSE_SIZE = SCSIPassThroughDirectWithBuffer.sense.size
+_SENSE_OFFSET = SCSIPassThroughDirectWithBuffer.sense.offset
+
 
 class WindowsSCSIDevice(SCSIDevice):
     def __enter__(self):
         if self.fd is not None:
             raise IOError("Device is already open.")
 
+        # Bound once per open so every command afterwards skips the
+        # function call to look the DLL handle back up.
+        self._kernel32 = get_kernel32()
+
         # We can't use the normal approach to opening a file on Windows, as
         # various Python APIs can't handle a device opened without specific
         # flags, see (https://bugs.python.org/issue37074)
-        self.fd = get_kernel32().CreateFileW(
+        self.fd = self._kernel32.CreateFileW(
             self.path,
             0x80000000 | 0x40000000,  # GENERIC_READ | GENERIC_WRITE
             0x00000001,  # FILE_SHARE_READ
@@ -29,14 +38,22 @@ class WindowsSCSIDevice(SCSIDevice):
             None,
         )
 
-        if self.fd == -1:
+        if self.fd == INVALID_HANDLE_VALUE:
             raise ctypes.WinError(ctypes.get_last_error())
 
+        # Reused for every command issued while the device is open, so a
+        # monitoring loop isn't allocating and zeroing a fresh passthrough
+        # buffer per command.
+        self._pass_through = SCSIPassThroughDirectWithBuffer()
+        # byref is a lightweight argument marker, where ctypes.pointer would
+        # construct a full POINTER object.
+        self._pass_through_ref = ctypes.byref(self._pass_through)
+
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.fd is not None:
-            get_kernel32().CloseHandle(self.fd)
+            self._kernel32.CloseHandle(self.fd)
             self.fd = None
         return False
 
@@ -48,48 +65,64 @@ class WindowsSCSIDevice(SCSIDevice):
         *,
         timeout: int = 3000,
     ) -> SCSIResponse:
-        # On Windows, the command block is always 16 bytes, but we may be
-        # sending a smaller command. We use a temporary mutable bytearray for
-        # this.
-        cdb = (ctypes.c_ubyte * 16).from_buffer_copy(
-            bytearray(command).ljust(16, b"\x00")  # noqa
-        )
-
         if data is None:
             data = ctypes.create_string_buffer(0)
 
-        header_with_buffer = SCSIPassThroughDirectWithBuffer(
-            sptd=SCSIPassThroughDirect(
-                length=ctypes.sizeof(SCSIPassThroughDirect),
-                data_in={
-                    Direction.TO: 0,
-                    Direction.FROM: 1,
-                    Direction.NONE: 2,
-                }.get(direction),
-                data_transfer_length=ctypes.sizeof(data),
-                data_buffer=ctypes.addressof(data),
-                cdb_length=ctypes.sizeof(command),
-                cdb=cdb,
-                timeout_value=max(timeout // 1000, 1),
-                sense_info_length=SCSIPassThroughDirectWithBuffer.sense.size,
-                sense_info_offset=(
-                    SCSIPassThroughDirectWithBuffer.sense.offset
-                ),
-            )
+        # Reset and refill the per-device passthrough buffer in place. Note
+        # that this means the platform_header on the returned response is
+        # only valid until the next command is issued on this device.
+        header_with_buffer = self._pass_through
+        ctypes.memset(
+            ctypes.addressof(header_with_buffer),
+            0,
+            ctypes.sizeof(header_with_buffer),
+        )
+
+        sptd = header_with_buffer.sptd
+        sptd.length = ctypes.sizeof(SCSIPassThroughDirect)
+        sptd.data_in = {
+            Direction.TO: 0,
+            Direction.FROM: 1,
+            Direction.NONE: 2,
+        }.get(direction)
+        sptd.data_transfer_length = ctypes.sizeof(data)
+        sptd.data_buffer = ctypes.addressof(data)
+        sptd.cdb_length = ctypes.sizeof(command)
+        # On Windows, the command block is always 16 bytes, but we may be
+        # sending a smaller command. The memset above already zeroed the
+        # slot, so one memmove gives us the zero-padded CDB in place.
+        ctypes.memmove(
+            ctypes.addressof(sptd.cdb),
+            ctypes.addressof(command),
+            ctypes.sizeof(command),
         )
+        sptd.timeout_value = max(timeout // 1000, 1)
+        sptd.sense_info_length = _SENSE_SIZE
+        sptd.sense_info_offset = _SENSE_OFFSET
 
-        result = get_kernel32().DeviceIoControl(
+        result = self._kernel32.DeviceIoControl(
             self.fd,
             IOCTL_SCSI_PASS_THROUGH_DIRECT,
-            ctypes.pointer(header_with_buffer),
+            self._pass_through_ref,
             ctypes.sizeof(header_with_buffer),
-            ctypes.pointer(header_with_buffer),
+            self._pass_through_ref,
             ctypes.sizeof(header_with_buffer),
             None,
             None,
         )
 
-        self.parse_sense(bytearray(header_with_buffer.sense))
+        # The overwhelming majority of commands complete with no sense data
+        # at all, so peek at the response code before paying for extraction
+        # and parsing. When we do parse, ctypes.string_at is a single memcpy,
+        # where bytearray() would iterate the array element-by-element.
+        sense = None
+        if header_with_buffer.sense[0] & 0x7F:
+            sense = self.parse_sense(
+                ctypes.string_at(
+                    ctypes.addressof(header_with_buffer) + _SENSE_OFFSET,
+                    _SENSE_SIZE,
+                )
+            )
 
         if result == 0:
             raise ctypes.WinError(ctypes.get_last_error())
@@ -99,7 +132,7 @@ class WindowsSCSIDevice(SCSIDevice):
                 header_with_buffer.sptd.scsi_status == 0
                 or header_with_buffer.sptd.scsi_status == 2
             ),
-            sense=self.parse_sense(bytearray(header_with_buffer.sense)),
+            sense=sense,
             platform_header=header_with_buffer,
             command=command,
             bytes_transferred=header_with_buffer.sptd.data_transfer_length,
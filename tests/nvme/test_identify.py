@@ -0,0 +1,68 @@
+import ctypes
+
+from smartie.nvme import NVMeDevice
+from smartie.nvme.structures import NVMeIdentifyResponse
+
+from tests.nvme.utils import MockedNVMeDevice
+
+
+def make_identify_response() -> bytes:
+    identify = NVMeIdentifyResponse()
+    ctypes.memmove(identify.serial_number, b"S64ANS0T508638J     ", 20)
+    ctypes.memmove(
+        identify.model_number,
+        b"Samsung SSD 990 PRO 2TB                 ",
+        40,
+    )
+    return bytes(identify)
+
+
+def test_identify():
+    """
+    Test we're properly parsing the response to an NVMe IDENTIFY.
+    """
+    with MockedNVMeDevice(
+        "/dev/nvme0n1", return_data=make_identify_response()
+    ) as device:
+        assert device.model == "Samsung SSD 990 PRO 2TB"
+        assert device.serial == "S64ANS0T508638J"
+        assert device.identify_strings() == (
+            "S64ANS0T508638J",
+            "Samsung SSD 990 PRO 2TB",
+        )
+        assert device.commands_issued == 1
+
+
+def test_identify_is_cached():
+    """
+    Test repeated property reads reuse a single IDENTIFY round-trip, and
+    that refresh() invalidates the cache.
+    """
+    with MockedNVMeDevice(
+        "/dev/nvme0n1", return_data=make_identify_response()
+    ) as device:
+        assert device.serial == "S64ANS0T508638J"
+        assert device.model == "Samsung SSD 990 PRO 2TB"
+        assert device.commands_issued == 1
+
+        device.refresh()
+        assert device.serial == "S64ANS0T508638J"
+        assert device.commands_issued == 2
+
+
+def test_identify_many():
+    """
+    Test identify_many() returns results in input order.
+    """
+    devices = [
+        MockedNVMeDevice(
+            f"/dev/nvme{i}n1", return_data=make_identify_response()
+        )
+        for i in range(4)
+    ]
+
+    results = NVMeDevice.identify_many(devices)
+    assert len(results) == 4
+    for device, (identify, response) in zip(devices, results):
+        assert response.succeeded
+        assert device.commands_issued == 1
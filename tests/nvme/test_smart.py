@@ -0,0 +1,43 @@
+from smartie.nvme.structures import (
+    SMARTPageResponse,
+    smart_page_to_dict,
+)
+from smartie.structures import structure_to_dict
+
+from tests.nvme.utils import MockedNVMeDevice
+
+
+def make_smart_response() -> SMARTPageResponse:
+    smart = SMARTPageResponse()
+    smart.critical_warning.temperature = 1
+    smart.temperature = 310
+    smart.available_spare = 100
+    smart.percent_used = 3
+    smart.data_units_read.low = 0xDEADBEEF
+    smart.data_units_read.high = 0x01
+    smart.power_on_hours.low = 8784
+    smart.temperature_sensors[0] = 310
+    smart.temperature_sensors[1] = 305
+    return smart
+
+
+def test_smart_page_to_dict():
+    """
+    Test the one-pass SMART page unpacker matches the generic
+    structure walker.
+    """
+    smart = make_smart_response()
+    assert smart_page_to_dict(bytes(smart)) == structure_to_dict(smart)
+
+
+def test_smart_table():
+    """
+    Test reading the SMART table and temperature from a mocked device.
+    """
+    with MockedNVMeDevice(
+        "/dev/nvme0n1", return_data=bytes(make_smart_response())
+    ) as device:
+        table = device.smart_table
+        assert table["temperature"] == 310
+        assert table["critical_warning"]["temperature"] == 1
+        assert device.temperature == 36
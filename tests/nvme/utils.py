@@ -0,0 +1,43 @@
+import ctypes
+from typing import Optional
+
+from smartie.nvme import NVMeDevice, NVMeResponse
+from smartie.nvme.structures import NVMeAdminCommand
+
+
+class MockedNVMeDevice(NVMeDevice):
+    def __init__(
+        self,
+        *args,
+        return_data: Optional[bytes] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self._return_data = return_data
+        self.commands_issued = 0
+
+    def issue_admin_command(self, command: NVMeAdminCommand) -> NVMeResponse:
+        self.commands_issued += 1
+
+        if self._return_data:
+            ctypes.memmove(
+                command.addr,
+                self._return_data,
+                min(len(self._return_data), command.data_len),
+            )
+
+        return NVMeResponse(
+            succeeded=True,
+            command_spec=None,
+            status_field=None,
+            command=command,
+            bytes_transferred=None,
+            platform_header=None,
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.refresh()
+        return False